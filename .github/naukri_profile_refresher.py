@@ -5,6 +5,9 @@ Naukri Profile Refresher - COMPLETE FIXED VERSION
 - Better error handling and reporting
 - Chrome WebDriver compatible with GitHub Actions
 - Skills update as fallback strategy for reliability
+- Optional "accounts" list in config.json refreshes several accounts in parallel
+- --daemon keeps one browser open and refreshes hourly until 10:00 PM IST
+- "update_all_sections": true in config.json updates every section in one run
 
 SCHEDULE (GitHub Actions):
 - Runs every hour at :00 (e.g., 7:00, 8:00, 9:00...)
@@ -15,18 +18,31 @@ SCHEDULE (GitHub Actions):
 
 import os
 import time
+import base64
+import socket
+import tempfile
 import json
 import random
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException,
+    ElementNotInteractableException, StaleElementReferenceException
+)
+
+# Optional: orjson encodes and writes bytes directly; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -38,11 +54,323 @@ logger = logging.getLogger(__name__)
 class NaukriProfileRefresher:
     """Complete fixed version with robust save functionality"""
     
-    def __init__(self, config_file="config.json"):
+    PROFILE_URL = 'https://www.naukri.com/mnjuser/profile'
+    
+    # Elements used as explicit wait targets instead of fixed sleeps
+    EDIT_ICON_SELECTOR = '.edit.icon'
+    MODAL_SELECTOR = '.modal, [role="dialog"]'
+    EDIT_FORM_SELECTOR = '.modal, [role="dialog"], textarea'
+    # Same group minus elements already visible before the edit click (chat drawers,
+    # banners, other textareas) - see MARK_OPEN_FORMS_JS
+    NEW_EDIT_FORM_SELECTOR = ', '.join(
+        f'{part.strip()}:not([data-refresher-preopen])' for part in EDIT_FORM_SELECTOR.split(',')
+    )
+    SAVE_CONFIRMATION_SELECTOR = '.success-toast, .alert-success, [class*="success"][role="alert"]'
+    MODAL_CLOSE_SELECTOR = '.modal .crossIcon, .crossLayer, [aria-label="close"], [aria-label="Close"]'
+    HEADLINE_FIELD_SELECTOR = (
+        'textarea[name="resumeHeadline"], input[name="resumeHeadline"], '
+        'textarea[name="headline"], textarea[placeholder*="headline" i]'
+    )
+    SUMMARY_FIELD_SELECTOR = (
+        'textarea[name="summary"], textarea[name="profileSummary"], '
+        'textarea[placeholder*="summary" i]'
+    )
+    EDIT_CONTROL_SELECTOR = '.edit.icon, [class*="edit"], [title="Edit"], [aria-label="Edit"]'
+    
+    # Trackers, ads, images and fonts the bot never needs - blocked at the browser.
+    # SVGs stay allowed: edit controls may be SVG images, and a blocked one renders
+    # at zero size, which Selenium treats as not displayed
+    BLOCKED_URL_PATTERNS = (
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*googlesyndication.com*', '*adservice*',
+        '*facebook.com/tr*', '*facebook.net*', '*hotjar.com*', '*clarity.ms*',
+        '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.woff*', '*.ttf'
+    )
+    
+    # Clicks the cookie consent button if the banner is up - a button reading
+    # "Accept"/"Got it" or the banner's accept control - in a single call
+    COOKIE_ACCEPT_JS = """
+        for (const e of document.querySelectorAll('button, #accept-cookies')) {
+            if (e.getClientRects().length > 0 &&
+                    (/accept|got it/i.test(e.textContent) ||
+                     e.matches('#accept-cookies, [class*="cookies-accept"]'))) {
+                e.click();
+                return e;
+            }
+        }
+        return null;
+    """
+    
+    # Login form fields as single comma-joined CSS groups - one query per field
+    EMAIL_FIELD_SELECTOR = '#usernameField, #emailField, #email, input[placeholder*="email" i]'
+    PASSWORD_FIELD_SELECTOR = '#passwordField, #password, input[type="password"]'
+    LOGIN_BUTTON_SELECTOR = 'button[type="submit"], button[class*="loginButton"]'
+    LOGIN_BUTTON_TEXT = 'Login'
+    
+    # First visible match for each selector group in the arguments, as a list -
+    # the login form's fields come back from one query
+    FIRST_VISIBLE_EACH_JS = """
+        return [...arguments].map(selector => [...document.querySelectorAll(selector)]
+            .find(e => e.getClientRects().length > 0 && !e.disabled) || null);
+    """
+    
+    # Clicks the first visible login button - CSS group first, then any button
+    # reading "Login" - and returns its text, or null when neither is on the page
+    CLICK_LOGIN_BUTTON_JS = """
+        const [selector, text] = arguments;
+        const visible = e => e.getClientRects().length > 0 && !e.disabled;
+        const button = [...document.querySelectorAll(selector)].find(visible) ||
+            [...document.querySelectorAll('button')]
+                .find(e => visible(e) && e.textContent.trim().includes(text));
+        if (!button) return null;
+        button.click();
+        return button.textContent.trim();
+    """
+    
+    # Container class names for each section, used by the last edit-control fallback
+    SECTION_CLASS_MAP = {
+        "Resume headline": ("resumeHeadline", "resume-headline", "headline"),
+        "Profile summary": ("summary", "profileSummary", "profile-summary"),
+        "Key skills": ("keySkills", "key-skills", "skills")
+    }
+    
+    # ...pre-joined into one CSS group per section - a single lookup per fallback
+    SECTION_EDIT_SELECTORS = {
+        section: ', '.join(
+            f'[class*="{class_name}"] {edit}'
+            for class_name in class_names
+            for edit in ('[class*="edit"]', '[title="Edit"]')
+        )
+        for section, class_names in SECTION_CLASS_MAP.items()
+    }
+    
+    # Edit control lookups relative to a section label, formatted with t=<label>
+    EDIT_XPATH_TEMPLATES = (
+        "//div[contains(., '{t}')]//span[contains(@class, 'edit')]",
+        "//div[contains(., '{t}')]//button[contains(@class, 'edit')]",
+        "//div[contains(., '{t}')]//a[contains(@class, 'edit')]",
+        "//div[contains(., '{t}')]//*[@title='Edit' or @aria-label='Edit']",
+        "//div[contains(., '{t}')]//i[contains(@class, 'edit')]",
+        "//span[text()='{t}']/following-sibling::*[contains(@class, 'edit')]",
+        "//span[contains(text(), '{t}')]/parent::*//*[contains(@class, 'edit')]"
+    )
+    
+    # text= and CSS candidates (XPath also accepted) - see FIRST_VISIBLE_CANDIDATE_JS
+    SAVE_BUTTON_CANDIDATES = (
+        # Text-based selectors
+        "text=save",
+        "text=update",
+        "text=submit",
+        "text=apply",
+        "text=ok",
+        "text=done",
+        
+        # Class-based selectors
+        'button[class*="save" i]',
+        'button[class*="submit" i]',
+        'button[class*="primary" i]',
+        'button[class*="positive" i]',
+        
+        # Type-based selectors
+        'button[type="submit"]',
+        'input[type="submit"]',
+        'button[type="button"][class*="primary"]',
+        
+        # Form selectors
+        'form button[type="submit"]',
+        'form button[class*="primary"]',
+        'form button:not([type="button"]):not([type="reset"])',
+        
+        # Modal/Dialog selectors
+        'div[role="dialog"] button[class*="primary"]',
+        'div[role="dialog"] button[type="submit"]',
+        'div[class*="modal"] button[class*="primary"]',
+        
+        # Naukri-specific possibilities
+        'button#saveButton',
+        'button[ng-click*="save"]',
+        'button[onclick*="save"]'
+    )
+    
+    # Last-resort save detection by button text / class
+    SAVE_TEXT_KEYWORDS = ('save', 'update', 'submit', 'apply', 'done', 'ok', 'confirm')
+    SAVE_CLASS_KEYWORDS = ('primary', 'submit', 'save', 'positive', 'success')
+    
+    # Scores every visible, enabled button - save-like text 10, save-like class 5,
+    # type=submit 3, inside a form or dialog 2 - and clicks the best one rather
+    # than the first in document order (often a header button). Returns its text,
+    # or null when no button scored
+    CLICK_SAVE_LIKE_BUTTON_JS = """
+        const [textKeywords, classKeywords] = arguments;
+        let best = null, bestScore = 0;
+        for (const b of document.querySelectorAll('button')) {
+            if (b.getClientRects().length === 0 || b.disabled ||
+                    b.getAttribute('aria-disabled') === 'true') continue;
+            const text = b.textContent.trim().toLowerCase();
+            const cls = (b.getAttribute('class') || '').toLowerCase();
+            const keyword = textKeywords.some(k => text.includes(k)) * 10 +
+                            classKeywords.some(k => cls.includes(k)) * 5;
+            if (!keyword) continue;
+            const score = keyword + (b.type === 'submit') * 3 +
+                          (b.closest('form, [role="dialog"], .modal') !== null) * 2;
+            if (score > bestScore) {
+                best = b;
+                bestScore = score;
+            }
+        }
+        if (!best) return null;
+        best.scrollIntoView({block: 'center'});
+        best.click();
+        return best.textContent.trim();
+    """
+    
+    # Maps each edit control to the first line of its container's text,
+    # e.g. {"resume headline": <span.edit.icon>}
+    EDIT_SNAPSHOT_JS = """
+        const map = {};
+        for (const edit of document.querySelectorAll(arguments[0])) {
+            const container = edit.closest('section, div');
+            if (!container) continue;
+            const label = (container.innerText || '').split('\\n')[0].trim().toLowerCase();
+            if (label && !(label in map)) map[label] = edit;
+        }
+        return map;
+    """
+    
+    # Walks text nodes for the section label (cheaper than reading textContent of
+    # every div), climbs to the nearest ancestor holding an edit control and
+    # clicks it - one browser round-trip instead of a ladder of XPath probes
+    EDIT_CLICK_JS = """
+        const label = arguments[0].toLowerCase();
+        const editSelector = arguments[1];
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        const nodes = [];
+        for (let t = walker.nextNode(); t; t = walker.nextNode()) {
+            const el = t.parentElement;
+            if (el && el.offsetParent !== null &&
+                t.data.trim().toLowerCase().startsWith(label)) {
+                nodes.push(el);
+            }
+        }
+        for (const node of nodes) {
+            for (let p = node; p; p = p.parentElement) {
+                const edit = p.querySelector(editSelector);
+                if (edit && edit.offsetParent !== null) {
+                    edit.scrollIntoView({block: 'center'});
+                    edit.click();
+                    return true;
+                }
+            }
+        }
+        return false;
+    """
+    
+    # Whether any match of a CSS group is visible. EC's visibility conditions
+    # only look at the first match, so a hidden .modal or textarea earlier in
+    # the page would decide them
+    ANY_VISIBLE_JS = """
+        return [...document.querySelectorAll(arguments[0])]
+            .some(e => e.getClientRects().length > 0 &&
+                       getComputedStyle(e).visibility !== 'hidden');
+    """
+    
+    # Tags the form-like elements visible right now, so the form an edit click
+    # opens can be told apart from dialogs that were already on the page
+    MARK_OPEN_FORMS_JS = """
+        for (const e of document.querySelectorAll('[data-refresher-preopen]')) {
+            e.removeAttribute('data-refresher-preopen');
+        }
+        for (const e of document.querySelectorAll(arguments[0])) {
+            if (e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden') {
+                e.setAttribute('data-refresher-preopen', '');
+            }
+        }
+    """
+    
+    # Whether a save has landed: the opened form is gone (detached or hidden) - or,
+    # when it wasn't captured, no newly opened form is visible - or a success toast shows
+    SAVE_LANDED_JS = """
+        const [form, formSelector, toastSelector] = arguments;
+        const visible = e => e.getClientRects().length > 0 &&
+                             getComputedStyle(e).visibility !== 'hidden';
+        const closed = form ? !(form.isConnected && visible(form))
+                            : ![...document.querySelectorAll(formSelector)].some(visible);
+        return closed || [...document.querySelectorAll(toastSelector)].some(visible);
+    """
+    
+    # First displayed, enabled match for a CSS group - replaces a pair of
+    # is_displayed()/is_enabled() round-trips per candidate with one call
+    FIRST_VISIBLE_JS = """
+        return [...document.querySelectorAll(arguments[0])]
+            .find(e => e.getClientRects().length > 0 && !e.disabled) || null;
+    """
+    
+    # Same lookup, but scrolls the match into view and clicks it in the same call;
+    # returns the clicked element (or null) so it can be cached
+    CLICK_FIRST_VISIBLE_JS = """
+        const e = [...document.querySelectorAll(arguments[0])]
+            .find(e => e.getClientRects().length > 0 && !e.disabled);
+        if (!e) return null;
+        e.scrollIntoView({block: 'center'});
+        e.click();
+        return e;
+    """
+    
+    # Index and element of the first displayed, enabled match across an ordered
+    # candidate list - the whole list is checked in one round-trip. A candidate is
+    # an XPath (leading "/"), "text=<keyword>" for a case-insensitive match on
+    # button text (lowercased once per call rather than XPath translate() per
+    # candidate), or a CSS selector. aria-disabled counts as disabled: save buttons
+    # stay in that state until the form's debounced validation has seen the new value
+    FIRST_VISIBLE_CANDIDATE_JS = """
+        const candidates = arguments[0];
+        let buttons = null;
+        const matches = c => {
+            if (c.startsWith('/')) {
+                const found = document.evaluate(c, document, null,
+                                                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                return Array.from({length: found.snapshotLength}, (_, j) => found.snapshotItem(j));
+            }
+            if (c.startsWith('text=')) {
+                buttons = buttons || [...document.querySelectorAll('button')]
+                    .map(b => [b, b.textContent.toLowerCase()]);
+                return buttons.filter(([, text]) => text.includes(c.slice(5))).map(([b]) => b);
+            }
+            return document.querySelectorAll(c);
+        };
+        for (let i = 0; i < candidates.length; i++) {
+            for (const e of matches(candidates[i])) {
+                if (e.getClientRects().length > 0 && !e.disabled &&
+                        e.getAttribute('aria-disabled') !== 'true') return [i, e];
+            }
+        }
+        return null;
+    """
+    
+    # Debug screenshots, uploaded as an artifact by the workflow when a run fails
+    SCREENSHOT_DIR = "debug_screenshots"
+    
+    def __init__(self, config_file="config.json", account_index=None):
         """Initialize with flexible config reading"""
         self.config = self._load_config(config_file)
         self.driver = None
-        self.wait = None
+        
+        # One entry of an "accounts" list: its own credentials, and a suffix that
+        # keeps its state, cookies and browser profile apart from the other accounts.
+        # Account 0 keeps the unsuffixed files, so adding a second account doesn't
+        # orphan the first one's logged-in profile, cookies and rotation state
+        suffix = ""
+        if account_index is not None:
+            account = self.config['accounts'][account_index]
+            self.config['credentials'] = {
+                'email': account['email'],
+                'password': account['password']
+            }
+            if account_index:
+                suffix = f"_{account_index}"
+        
+        # Per-character typing is only kept for a "paranoid" human-like mode
+        self.humanize = self.config.get('humanize_typing', False)
         
         # Simplified to most reliable strategies
         self.update_strategies = [
@@ -51,19 +379,67 @@ class NaukriProfileRefresher:
             'skills_update'
         ]
         
-        # State tracking files
-        self.state_files = {
-            'headline_toggle': 'headline_toggle_state.txt',
-            'summary_fullstop': 'summary_fullstop_state.txt'
+        # Strategy name -> update method; skills_update is the most reliable fallback
+        self._dispatch = {
+            'headline_toggle': self._update_headline,
+            'summary_fullstop_toggle': self._update_summary,
+            'skills_update': self._update_skills
         }
+        self.fallback_strategy = 'skills_update'
+        
+        # Legacy .txt state predates multi-account runs and belongs to the first account only
+        self._owns_legacy_state = account_index in (None, 0)
+        
+        # Toggle states and the last used strategy, read once and flushed once per run
+        self.state_path = f"toggle_states{suffix}.json"
+        self._states = self._load_states()
+        # Migrated legacy values still need writing to the new file
+        self._states_dirty = self._states_mtime is None and bool(self._states)
+        
+        # How often each fallback selector matched, so the usual winner is tried first
+        self.selector_stats_path = f"selector_stats{suffix}.json"
+        self._sel_stats = self._read_json(self.selector_stats_path)
+        self._stats_dirty = False
         
-        self.last_strategy_file = "last_strategy.txt"
+        # Summary of a successful run, written alongside the state files
+        self.log_path = f"profile_refresh_log{suffix}.json"
+        self._session_log = None
+        self._used_strategy = None
+        
+        # Saved session cookies - lets later runs skip the login form
+        self.cookie_file = f"naukri_cookies{suffix}.json"
+        
+        # Persistent browser profile and cached driver binary location
+        # (config can point the profile outside the checkout, e.g. the user's home)
+        self.profile_dir = os.path.expanduser(self.config.get('chrome_profile_dir', ".chrome_profile")) + suffix
+        self.driver_cache_file = ".driver_cache.json"
+        
+        # Edit controls on the loaded profile page, keyed by section label
+        self._edit_map = {}
+        
+        # WebDriverWait instances reused per timeout; reset with each new driver
+        self._waits = {}
+        self._waits_driver = None
+        
+        # Edit form opened by the last edit click, watched by the save confirmation
+        self._open_form = None
+        
+        # Last URL requested with driver.get, so a loaded profile page isn't reloaded
+        self._current_url = None
         
     def _load_config(self, config_file):
-        """Load configuration from ANY config.json structure"""
+        """
+        Load configuration from ANY config.json structure.
+        Also accepts an already-parsed config dict, so several refreshers can share one read.
+        """
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            if isinstance(config_file, dict):
+                # Shallow copy - credentials are replaced per instance below
+                config = dict(config_file)
+                config_file = "config dict"
+            else:
+                with open(config_file, 'r') as f:
+                    config = json.load(f)
             
             # Handle MULTIPLE config structures
             credentials = None
@@ -92,6 +468,14 @@ class NaukriProfileRefresher:
                 }
                 logger.info(f"Loaded credentials from {config_file} (direct structure)")
             
+            # Structure 4: "accounts" list - first entry unless an account is chosen
+            elif config.get('accounts'):
+                credentials = {
+                    'email': config['accounts'][0]['email'],
+                    'password': config['accounts'][0]['password']
+                }
+                logger.info(f"Loaded {len(config['accounts'])} accounts from {config_file} (accounts structure)")
+            
             else:
                 raise ValueError("Could not find credentials in config file")
             
@@ -106,9 +490,47 @@ class NaukriProfileRefresher:
             logger.error(f"Config loading failed: {e}")
             raise
     
+    def _driver_alive(self):
+        """Check whether the current driver session still responds"""
+        if not self.driver:
+            return False
+        try:
+            return bool(self.driver.session_id and self.driver.title is not None)
+        except Exception:
+            # A dead chromedriver surfaces as a urllib3 connection error, not a WebDriverException
+            return False
+    
+    def _cached_driver_path(self):
+        """Return the chromedriver path recorded by an earlier run, if it is still on disk"""
+        driver_path = self._read_json(self.driver_cache_file).get('driver_path')
+        if driver_path and os.path.isfile(driver_path) and os.access(driver_path, os.X_OK):
+            logger.info(f"Using cached Chrome driver: {driver_path}")
+            return driver_path
+        return None
+    
+    @staticmethod
+    def _major_version(version):
+        """Major part of a dotted version string ('' when unknown)"""
+        return (version or '').split('.')[0]
+    
     def setup_driver(self, debug_mode=False):
         """Setup Chrome WebDriver with improved settings"""
         try:
+            # Only start a new browser when there is no live session to reuse
+            if self._driver_alive():
+                logger.info("Reusing existing Chrome session")
+                return True
+            
+            # A crashed session still owns its Chrome process and the profile lock -
+            # release both or the new browser can't open the same user-data-dir
+            if self.driver:
+                logger.warning("Previous Chrome session is dead - restarting")
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+            
             logger.info("Setting up Chrome WebDriver...")
             
             options = webdriver.ChromeOptions()
@@ -131,43 +553,70 @@ class NaukriProfileRefresher:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
+            # Skip image decoding and notification prompts; stylesheets stay on
+            # because edit-layer visibility checks depend on them
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2
+            })
+            # Renderer-level switch as well, so a content setting stored in the
+            # persistent profile can't turn images back on
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            
             # User agent
             options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
             
             # Window size
             options.add_argument('--window-size=1920,1080')
             
-            # Try automatic Chrome driver setup
+            # Return from driver.get at DOMContentLoaded; explicit waits cover the rest.
+            # config can pick 'none' to return immediately, but then the previous
+            # document may still be loaded when the first wait runs
+            options.page_load_strategy = self.config.get('page_load_strategy', 'eager')
+            
+            # Persistent profile keeps cookies/localStorage between runs
+            options.add_argument(f'--user-data-dir={os.path.abspath(self.profile_dir)}')
+            options.add_argument('--profile-directory=Default')
+            
+            # Start from the cached chromedriver path; Selenium Manager (built into
+            # Selenium 4.11+) only resolves one when there is no cache or it stopped working
+            cached_path = self._cached_driver_path()
             try:
-                service = ChromeService(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=options)
-                logger.info("Chrome driver auto-download successful")
-            except Exception as e:
-                logger.warning(f"Auto-download failed: {e}")
-                # Try manual paths
-                manual_paths = [
-                    "/usr/bin/chromedriver",
-                    "/usr/local/bin/chromedriver",
-                    r"C:\WebDrivers\chromedriver.exe",
-                    r"C:\chromedriver\chromedriver.exe",
-                    "chromedriver"
-                ]
-                
-                driver_found = False
-                for path in manual_paths:
-                    if os.path.exists(path):
-                        logger.info(f"Using manual path: {path}")
-                        service = ChromeService(path)
-                        self.driver = webdriver.Chrome(service=service, options=options)
-                        driver_found = True
-                        break
-                
-                if not driver_found:
-                    logger.error("No Chrome driver found!")
-                    return False
+                self.driver = webdriver.Chrome(service=ChromeService(cached_path), options=options)
+            except WebDriverException as e:
+                if not cached_path:
+                    raise
+                # Usually a Chrome upgrade that the cached driver no longer matches
+                logger.warning(f"Cached Chrome driver failed: {e}")
+                try:
+                    os.remove(self.driver_cache_file)
+                except FileNotFoundError:
+                    pass  # another account's browser already dropped it
+                self.driver = webdriver.Chrome(service=ChromeService(), options=options)
+            
+            browser_version = self.driver.capabilities.get('browserVersion') or ''
+            if self.driver.service.path != cached_path:
+                self._write_json(self.driver_cache_file, {
+                    'driver_path': self.driver.service.path,
+                    'browser_version': browser_version
+                })
+                logger.info(f"Chrome driver resolved by Selenium Manager: {self.driver.service.path}")
+            elif self._major_version(browser_version) != self._major_version(
+                    self._read_json(self.driver_cache_file).get('browser_version')):
+                # Chrome auto-updated to a new major and the old driver happened to
+                # still start - drop the cache so the next run resolves a matching one
+                logger.info(f"Chrome is now {browser_version} - cached driver will be re-resolved next run")
+                try:
+                    os.remove(self.driver_cache_file)
+                except FileNotFoundError:
+                    pass
             
-            self.driver.implicitly_wait(10)
-            self.wait = WebDriverWait(self.driver, 20)
+            self._widen_connection_pool()
+            self._block_heavy_resources()
+            
+            # No implicit wait: it compounds with every explicit wait and makes
+            # each missed selector in the fallback loops block for the full timeout
+            self.driver.implicitly_wait(0)
             
             logger.info("Chrome driver setup successful")
             return True
@@ -176,112 +625,239 @@ class NaukriProfileRefresher:
             logger.error(f"Chrome driver setup failed: {e}")
             return False
     
+    def _wait(self, timeout):
+        """
+        Return the shared WebDriverWait for a timeout, building it on first use.
+        Polls every 100ms - the 500ms default adds ~250ms to every wait on average.
+        """
+        # Waits are bound to a driver; drop them if the driver was swapped out
+        # (new session, or a caller assigning self.driver directly)
+        if self._waits_driver is not self.driver:
+            self._waits = {}
+            self._waits_driver = self.driver
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout, poll_frequency=0.1)
+        return wait
+    
+    def _wait_for(self, condition, timeout=10):
+        """Wait for an expected condition, returning its result or None on timeout"""
+        try:
+            return self._wait(timeout).until(condition)
+        except TimeoutException:
+            return None
+    
+    def _wait_for_profile(self, timeout=10):
+        """Wait until the profile page has rendered its edit icons"""
+        return self._wait_for(
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.EDIT_ICON_SELECTOR)),
+            timeout
+        )
+    
+    def _widen_connection_pool(self, maxsize=10):
+        """
+        Raise the urllib3 pool size used for driver commands.
+        Selenium's default pool holds a single connection, so any overlapping
+        command opens a fresh socket and logs 'Connection pool is full'.
+        """
+        try:
+            pool_manager = self.driver.command_executor._conn
+            pool_manager.connection_pool_kw.update(maxsize=maxsize, block=False)
+            # Drop the existing pool so the next command builds one with the new size
+            pool_manager.clear()
+        except AttributeError as e:
+            logger.warning(f"Could not resize driver connection pool: {e}")
+    
+    def _navigate(self, url):
+        """driver.get that remembers the requested URL"""
+        self.driver.get(url)
+        self._current_url = url
+    
+    def _on_profile_page(self):
+        """Check in one call that the profile page is loaded with its edit controls"""
+        if not self._current_url or '/mnjuser/profile' not in self._current_url:
+            return False
+        try:
+            return self.driver.execute_script(
+                "return location.pathname.startsWith('/mnjuser/profile')"
+                " && document.querySelector(arguments[0]) !== null;",
+                self.EDIT_ICON_SELECTOR
+            )
+        except WebDriverException:
+            return False
+    
+    def _open_profile(self):
+        """Load the profile page and snapshot its edit controls; False if it never rendered"""
+        self._navigate(self.PROFILE_URL)
+        loaded = self._wait_for_profile() is not None
+        self._snapshot_edit_controls()
+        return loaded
+    
+    def _reset_profile_page(self):
+        """Close any edit layer a failed strategy left open; reload only if the page is gone"""
+        try:
+            self.driver.execute_script(
+                "document.querySelectorAll(arguments[0]).forEach(e => e.click());",
+                self.MODAL_CLOSE_SELECTOR
+            )
+        except WebDriverException:
+            pass
+        self._wait_for_edit_form_closed(timeout=3)
+        
+        if not self._on_profile_page():
+            self._open_profile()
+    
+    def _snapshot_edit_controls(self):
+        """Capture all section edit controls in one call so strategies can reuse them"""
+        try:
+            self._edit_map = self.driver.execute_script(
+                self.EDIT_SNAPSHOT_JS, self.EDIT_ICON_SELECTOR
+            ) or {}
+        except WebDriverException as e:
+            logger.warning(f"Could not snapshot edit controls: {e}")
+            self._edit_map = {}
+    
+    def _block_heavy_resources(self):
+        """Block analytics, ad and media requests through the DevTools protocol"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd(
+                'Network.setBlockedURLs', {'urls': list(self.BLOCKED_URL_PATTERNS)}
+            )
+        except WebDriverException as e:
+            logger.warning(f"Could not set up request blocking: {e}")
+    
+    def _is_logged_in(self):
+        """Check whether the current page is an authenticated Naukri page"""
+        # Match on the path only - the login redirect carries the profile URL in its query
+        path = urlparse(self.driver.current_url).path
+        return path.startswith("/mnjuser") or "homepage" in path
+    
+    def _profile_session_valid(self):
+        """Open the profile page and report whether it rendered rather than bouncing to login"""
+        self._navigate(self.PROFILE_URL)
+        self._wait_for(EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.EDIT_ICON_SELECTOR)),
+            EC.url_contains('login')
+        ))
+        return self._is_logged_in()
+    
+    def _restore_session(self):
+        """Reuse a logged-in session from the persistent browser profile or saved cookies"""
+        try:
+            # The persistent Chrome profile usually still holds a live session
+            if self._profile_session_valid():
+                logger.info("Browser profile is still logged in - skipping login")
+                # Keep the cookie file current so it still works if the profile is lost
+                self._save_session()
+                return True
+            
+            if not os.path.exists(self.cookie_file):
+                return False
+            
+            with open(self.cookie_file, 'r') as f:
+                cookies = json.load(f)
+            
+            # Cookies can only be added for the domain currently loaded -
+            # the login page we were bounced to is on naukri.com already
+            for cookie in cookies:
+                if not cookie.get('domain', '').lstrip('.').endswith('naukri.com'):
+                    continue
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
+                    # Bad domain, sameSite or expiry on one cookie - skip it, keep the rest
+                    continue
+            
+            if self._profile_session_valid():
+                logger.info("Restored session from saved cookies - skipping login")
+                self._save_session()
+                return True
+            
+            logger.info("Saved cookies expired - doing full login")
+            return False
+            
+        except Exception as e:
+            logger.warning(f"Could not restore saved session: {e}")
+            return False
+    
+    def _save_session(self):
+        """Persist current cookies for the next run"""
+        try:
+            # Atomic write - a half-written file would force a full login next run
+            self._write_json(self.cookie_file, self.driver.get_cookies())
+            logger.info(f"Session cookies saved to {self.cookie_file}")
+        except Exception as e:
+            logger.warning(f"Could not save session cookies: {e}")
+    
     def login_to_naukri(self):
         """Login to Naukri using config credentials"""
         try:
+            # Reuse the previous session when its cookies are still valid
+            if self._restore_session():
+                return True
+            
             logger.info("Logging into Naukri...")
             
-            # Navigate to Naukri login
-            self.driver.get('https://www.naukri.com/nlogin/login')
-            time.sleep(3)
+            # Navigate to Naukri login - any cached edit controls are gone after this
+            self._edit_map = {}
+            self._navigate('https://www.naukri.com/nlogin/login')
+            
+            # The login form rendering is the signal the page is ready - one wait
+            # shared by all candidate selectors, and the password field comes back
+            # from the same poll when the form renders both at once
+            email_field, password_field = self._wait_for(
+                lambda driver: self._login_fields(),
+                timeout=15
+            ) or (None, None)
             
             # Handle cookie consent if present
             try:
-                cookie_buttons = [
-                    "//button[contains(text(), 'Accept')]",
-                    "//button[contains(text(), 'Got it')]",
-                    "//button[contains(@class, 'cookies-accept')]"
-                ]
-                for xpath in cookie_buttons:
-                    try:
-                        button = self.driver.find_element(By.XPATH, xpath)
-                        button.click()
-                        time.sleep(1)
-                        break
-                    except:
-                        continue
-            except:
+                button = self.driver.execute_script(self.COOKIE_ACCEPT_JS)
+                if button:
+                    self._wait_for(EC.invisibility_of_element(button), timeout=2)
+            except WebDriverException:
                 pass
             
-            # Fill email - try multiple selectors
-            email_field = None
-            email_selectors = [
-                "usernameField",
-                "emailField",
-                "email"
-            ]
-            
-            for selector_id in email_selectors:
-                try:
-                    email_field = self.wait.until(
-                        EC.presence_of_element_located((By.ID, selector_id))
-                    )
-                    break
-                except:
-                    continue
-            
+            # Fill email
             if not email_field:
-                # Try by placeholder
-                try:
-                    email_field = self.driver.find_element(
-                        By.XPATH, "//input[contains(@placeholder, 'Email') or contains(@placeholder, 'email')]"
-                    )
-                except:
-                    logger.error("Could not find email field")
-                    return False
-            
-            email_field.clear()
-            email_field.send_keys(self.config['credentials']['email'])
-            time.sleep(1)
+                logger.error("Could not find email field")
+                return False
             
-            # Fill password - try multiple selectors
-            password_field = None
-            password_selectors = [
-                "passwordField",
-                "password"
-            ]
+            self._fill_field(email_field, self.config['credentials']['email'])
             
-            for selector_id in password_selectors:
+            # Fill password
+            # Forms that reveal it after the email (or re-render it when the email
+            # changes) get a short explicit wait of their own
+            if password_field:
                 try:
-                    password_field = self.driver.find_element(By.ID, selector_id)
-                    break
-                except:
-                    continue
-            
+                    self._fill_field(password_field, self.config['credentials']['password'])
+                except StaleElementReferenceException:
+                    password_field = None
             if not password_field:
-                # Try by type
-                try:
-                    password_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-                except:
+                password_field = self._wait_visible(self.PASSWORD_FIELD_SELECTOR, timeout=5)
+                if not password_field:
                     logger.error("Could not find password field")
                     return False
+                self._fill_field(password_field, self.config['credentials']['password'])
             
-            password_field.clear()
-            password_field.send_keys(self.config['credentials']['password'])
-            time.sleep(1)
+            # Click login button - lookup, text fallback and click in one round-trip
+            clicked_text = self.driver.execute_script(
+                self.CLICK_LOGIN_BUTTON_JS, self.LOGIN_BUTTON_SELECTOR, self.LOGIN_BUTTON_TEXT
+            )
+            if clicked_text is None:
+                logger.warning("Could not find login button")
             
-            # Click login button
-            login_button = None
-            login_selectors = [
-                "//button[contains(text(), 'Login')]",
-                "//button[@type='submit']",
-                "//button[contains(@class, 'loginButton')]"
-            ]
-            
-            for xpath in login_selectors:
-                try:
-                    login_button = self.driver.find_element(By.XPATH, xpath)
-                    login_button.click()
-                    break
-                except:
-                    continue
-            
-            # Wait for login to complete
-            time.sleep(5)
+            # Wait for the post-login redirect
+            self._wait_for(EC.any_of(
+                EC.url_contains('naukri.com/mnjuser'),
+                EC.url_contains('homepage')
+            ), timeout=15)
             
             # Check if login successful
-            if "naukri.com/mnjuser" in self.driver.current_url or "homepage" in self.driver.current_url:
+            if self._is_logged_in():
                 logger.info("Login successful!")
+                self._save_session()
                 return True
             else:
                 logger.warning("Login may have issues - continuing anyway")
@@ -298,126 +874,205 @@ class NaukriProfileRefresher:
         """
         try:
             logger.info(f"Looking for '{section_text}' section...")
+            self._mark_open_forms()
             
-            # Strategy 1: Find heading text, then find edit icon in same container
+            # Fast path: edit control captured on page load or by an earlier lookup
+            cache_key = section_text.lower()
+            edit_button = self._edit_map.get(cache_key)
+            if edit_button is not None:
+                try:
+                    edit_button.click()
+                    logger.info(f"Clicked cached edit for '{section_text}'")
+                    self._wait_for_edit_form()
+                    return True
+                except StaleElementReferenceException:
+                    logger.debug(f"Cached edit for '{section_text}' went stale")
+                    self._edit_map.pop(cache_key, None)
+                except WebDriverException:
+                    # Hidden or covered - forget it and search the page
+                    self._edit_map.pop(cache_key, None)
+            
+            # Strategy 1: Locate and click the edit control inside the browser
             try:
-                # Find the section by its heading text
-                section_xpath = f"//div[contains(., '{section_text}')]"
-                section_element = self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, section_xpath))
-                )
-                
-                # Scroll to the section
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", section_element)
-                time.sleep(1)
-                
-                # Find edit button/icon within or near this section
-                edit_selectors = [
-                    f"//div[contains(., '{section_text}')]//span[contains(@class, 'edit')]",
-                    f"//div[contains(., '{section_text}')]//button[contains(@class, 'edit')]",
-                    f"//div[contains(., '{section_text}')]//a[contains(@class, 'edit')]",
-                    f"//div[contains(., '{section_text}')]//*[@title='Edit' or @aria-label='Edit']",
-                    f"//div[contains(., '{section_text}')]//i[contains(@class, 'edit')]",
-                    f"//span[text()='{section_text}']/following-sibling::*[contains(@class, 'edit')]",
-                    f"//span[contains(text(), '{section_text}')]/parent::*//*[contains(@class, 'edit')]"
-                ]
-                
-                for selector in edit_selectors:
-                    try:
-                        edit_button = self.driver.find_element(By.XPATH, selector)
-                        if edit_button.is_displayed():
-                            # Try regular click first
-                            try:
-                                edit_button.click()
-                                logger.info(f"Clicked edit for '{section_text}'")
-                                time.sleep(2)
-                                return True
-                            except:
-                                # If regular click fails, try JavaScript click
-                                self.driver.execute_script("arguments[0].click();", edit_button)
-                                logger.info(f"JS clicked edit for '{section_text}'")
-                                time.sleep(2)
-                                return True
-                    except:
-                        continue
-                
-            except TimeoutException:
-                logger.warning(f"Could not find section with text '{section_text}'")
-            
-            # Strategy 2: Try finding by class names that might contain the section
-            section_class_mappings = {
-                "Resume headline": ["resumeHeadline", "resume-headline", "headline"],
-                "Profile summary": ["summary", "profileSummary", "profile-summary"],
-                "Key skills": ["keySkills", "key-skills", "skills"]
-            }
+                if self.driver.execute_script(self.EDIT_CLICK_JS, section_text, self.EDIT_CONTROL_SELECTOR):
+                    logger.info(f"Clicked edit for '{section_text}'")
+                    self._wait_for_edit_form()
+                    return True
+            except WebDriverException as e:
+                logger.warning(f"In-page edit lookup failed: {e}")
+            
+            # Strategy 2: Find edit icon in the container holding the heading text -
+            # all XPath candidates evaluated in one call, in ranked order
+            templates = self._ranked('edit', self.EDIT_XPATH_TEMPLATES)
+            xpaths = [template.format(t=section_text) for template in templates]
+            matched = {}
+            
+            def locate_edit_button():
+                match = self.driver.execute_script(self.FIRST_VISIBLE_CANDIDATE_JS, xpaths)
+                if not match:
+                    return None
+                matched['template'] = templates[match[0]]
+                return match[1]
+            
+            try:
+                edit_button = self._safe_click(locate_edit_button)
+                if edit_button:
+                    logger.info(f"Clicked edit for '{section_text}'")
+                    self._edit_map[cache_key] = edit_button
+                    # Only a click that opened the form counts towards the ranking
+                    if self._wait_for_edit_form():
+                        self._record_hit('edit', matched['template'])
+                    return True
+            except WebDriverException as e:
+                logger.warning(f"XPath edit lookup failed: {e}")
             
-            if section_text in section_class_mappings:
-                for class_name in section_class_mappings[section_text]:
-                    try:
-                        edit_xpath = f"//*[contains(@class, '{class_name}')]//*[contains(@class, 'edit') or @title='Edit']"
-                        edit_button = self.driver.find_element(By.XPATH, edit_xpath)
-                        if edit_button.is_displayed():
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", edit_button)
-                            time.sleep(1)
-                            self.driver.execute_script("arguments[0].click();", edit_button)
-                            logger.info(f"Found and clicked edit via class '{class_name}'")
-                            time.sleep(2)
-                            return True
-                    except:
-                        continue
+            # Strategy 3: Try finding by class names that might contain the section
+            edit_selector = self.SECTION_EDIT_SELECTORS.get(section_text)
+            if edit_selector:
+                try:
+                    edit_button = self.driver.execute_script(self.CLICK_FIRST_VISIBLE_JS, edit_selector)
+                    if edit_button:
+                        logger.info(f"Found and clicked edit via section class for '{section_text}'")
+                        self._edit_map[cache_key] = edit_button
+                        self._wait_for_edit_form()
+                        return True
+                except WebDriverException as e:
+                    logger.warning(f"Class-based edit lookup failed: {e}")
             
             logger.error(f"Could not find edit button for '{section_text}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                self._debug_available_edit_spans()
             return False
             
         except Exception as e:
             logger.error(f"Error clicking edit for '{section_text}': {e}")
             return False
     
+    def _any_visible(self, css_selector):
+        """Whether any element matching a selector group is visible"""
+        return self.driver.execute_script(self.ANY_VISIBLE_JS, css_selector)
+    
+    def _mark_open_forms(self):
+        """Tag forms already visible before an edit click; forget the last opened form"""
+        self._open_form = None
+        try:
+            self.driver.execute_script(self.MARK_OPEN_FORMS_JS, self.EDIT_FORM_SELECTOR)
+        except WebDriverException as e:
+            logger.warning(f"Could not mark open forms: {e}")
+    
+    def _wait_for_edit_form(self, timeout=5):
+        """Wait for the edit layer opened by an edit click and remember it for the save wait"""
+        self._open_form = self._wait_for(
+            lambda driver: self._first_visible(self.NEW_EDIT_FORM_SELECTOR) or False, timeout
+        )
+        return self._open_form
+    
+    def _wait_for_edit_form_closed(self, timeout=5):
+        """Wait for the edit layer to close after saving"""
+        return self._wait_for(lambda driver: not self._any_visible(self.MODAL_SELECTOR), timeout)
+    
+    def _wait_for_save_confirmation(self, timeout=10):
+        """
+        Wait until the save has landed: the edit form is gone or a success toast shows.
+        Returning early could let the driver quit while the save request is in flight.
+        """
+        def landed(driver):
+            try:
+                return driver.execute_script(
+                    self.SAVE_LANDED_JS, self._open_form,
+                    self.NEW_EDIT_FORM_SELECTOR, self.SAVE_CONFIRMATION_SELECTOR
+                )
+            except StaleElementReferenceException:
+                # The opened form was removed from the page - it closed
+                return True
+        
+        return bool(self._wait_for(landed, timeout))
+    
+    def _debug_available_edit_spans(self):
+        """Log the edit controls present on the page, gathered in a single call"""
+        try:
+            spans = self.driver.execute_script("""
+                return [...document.querySelectorAll(arguments[0])].slice(0, 10).map(e => {
+                    const p = e.parentElement;
+                    return {text: ((p && p.innerText) || '').trim().slice(0, 50),
+                            visible: e.offsetParent !== null};
+                });
+            """, self.EDIT_CONTROL_SELECTOR)
+        except WebDriverException as e:
+            logger.debug(f"Could not list edit controls: {e}")
+            return
+        
+        logger.debug(f"Found {len(spans)} edit controls on page")
+        for idx, span in enumerate(spans):
+            logger.debug(f"  Edit {idx}: context='{span['text']}', visible={span['visible']}")
+    
+    def _debug_available_buttons(self):
+        """Log the visible buttons on the page, gathered in a single call"""
+        try:
+            total, buttons = self.driver.execute_script("""
+                const all = [...document.querySelectorAll('button')];
+                return [all.length, all.slice(0, 10).map((b, idx) => ({
+                    idx: idx, visible: b.getClientRects().length > 0,
+                    text: b.innerText.trim(), cls: b.className || 'no-class', type: b.type || 'no-type'
+                }))];
+            """)
+        except WebDriverException as e:
+            logger.warning(f"Could not enumerate buttons: {e}")
+            return
+        
+        logger.debug(f"Found {total} total buttons on page")
+        for btn in buttons:
+            if btn['visible']:
+                logger.debug(f"  Button {btn['idx']}: text='{btn['text']}', class='{btn['cls']}', type='{btn['type']}'")
+    
+    def _first_visible(self, css_selector):
+        """Return the first displayed and enabled element matching a CSS selector group"""
+        return self.driver.execute_script(self.FIRST_VISIBLE_JS, css_selector)
+    
+    def _login_fields(self):
+        """Email and password fields from one query; False until the email field is visible"""
+        fields = self.driver.execute_script(
+            self.FIRST_VISIBLE_EACH_JS, self.EMAIL_FIELD_SELECTOR, self.PASSWORD_FIELD_SELECTOR
+        )
+        return fields if fields[0] else False
+    
+    def _wait_visible(self, css_selector, timeout=10):
+        """Wait for the first visible, enabled element matching a selector; None on timeout"""
+        return self._wait_for(lambda driver: self._first_visible(css_selector) or False, timeout)
+    
+    def _field_selector(self, field_identifiers):
+        """Names, ids and placeholders combined into one selector group"""
+        return ', '.join(
+            f'{tag}[{attr}="{identifier}"]'
+            for identifier in field_identifiers
+            for attr in ('name', 'id', 'placeholder*')
+            for tag in ('textarea', 'input')
+        )
+    
+    def _wait_profile_field(self, css_selector, field_identifiers, timeout=10):
+        """
+        Wait for an edit-form field, accepting the known selector or any name/id/placeholder
+        match on the same poll - a drifted selector no longer costs the full timeout
+        before the identifier lookup runs. Falls back to _find_profile_field's textarea.
+        """
+        candidates = [css_selector, self._field_selector(field_identifiers)]
+        match = self._wait_for(
+            lambda driver: driver.execute_script(self.FIRST_VISIBLE_CANDIDATE_JS, candidates),
+            timeout
+        )
+        return match[1] if match else self._find_profile_field(field_identifiers)
+    
     def _find_profile_field(self, field_identifiers):
         """
         Find input/textarea fields using multiple strategies
         field_identifiers: list of possible names, ids, or placeholders
         """
         try:
-            # Try by name attribute
-            for identifier in field_identifiers:
-                try:
-                    field = self.driver.find_element(By.NAME, identifier)
-                    if field.is_displayed():
-                        return field
-                except:
-                    continue
-            
-            # Try by ID
-            for identifier in field_identifiers:
-                try:
-                    field = self.driver.find_element(By.ID, identifier)
-                    if field.is_displayed():
-                        return field
-                except:
-                    continue
-            
-            # Try by placeholder
-            for identifier in field_identifiers:
-                try:
-                    field = self.driver.find_element(
-                        By.XPATH, f"//textarea[contains(@placeholder, '{identifier}')] | //input[contains(@placeholder, '{identifier}')]"
-                    )
-                    if field.is_displayed():
-                        return field
-                except:
-                    continue
-            
-            # Try any visible textarea (last resort)
-            try:
-                textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
-                for textarea in textareas:
-                    if textarea.is_displayed() and textarea.is_enabled():
-                        return textarea
-            except:
-                pass
-            
-            return None
+            selector = self._field_selector(field_identifiers)
+            # Any visible textarea is the last resort - ranked behind the group,
+            # but checked in the same round-trip
+            match = self.driver.execute_script(self.FIRST_VISIBLE_CANDIDATE_JS, [selector, 'textarea'])
+            return match[1] if match else None
             
         except Exception as e:
             logger.error(f"Error finding field: {e}")
@@ -430,113 +1085,46 @@ class NaukriProfileRefresher:
         try:
             logger.info("Starting save button search...")
             
-            # First, let's see ALL buttons on the page for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                self._debug_available_buttons()
+            
+            # All candidates share one 5s clock instead of a 2s probe per selector
+            selectors = self._ranked('save', self.SAVE_BUTTON_CANDIDATES)
+            matched = {}
+            
+            def locate_save_button():
+                match = self._wait_for(
+                    lambda driver: driver.execute_script(self.FIRST_VISIBLE_CANDIDATE_JS, selectors),
+                    timeout=5
+                )
+                if not match:
+                    return None
+                matched['selector'] = selectors[match[0]]
+                return match[1]
+            
             try:
-                all_buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                logger.info(f"Found {len(all_buttons)} total buttons on page")
-                
-                # Log all visible button texts for debugging
-                for idx, btn in enumerate(all_buttons[:10]):  # Check first 10 buttons
-                    try:
-                        if btn.is_displayed():
-                            btn_text = btn.text.strip()
-                            btn_class = btn.get_attribute("class") or "no-class"
-                            btn_type = btn.get_attribute("type") or "no-type"
-                            logger.info(f"  Button {idx}: text='{btn_text}', class='{btn_class}', type='{btn_type}'")
-                    except:
-                        continue
-            except Exception as e:
-                logger.warning(f"Could not enumerate buttons: {e}")
-            
-            # Extended list of save button selectors
-            save_selectors = [
-                # Text-based selectors
-                "//button[contains(translate(text(), 'SAVE', 'save'), 'save')]",
-                "//button[contains(translate(text(), 'UPDATE', 'update'), 'update')]",
-                "//button[contains(translate(text(), 'SUBMIT', 'submit'), 'submit')]",
-                "//button[contains(translate(text(), 'APPLY', 'apply'), 'apply')]",
-                "//button[contains(translate(text(), 'OK', 'ok'), 'ok')]",
-                "//button[contains(translate(text(), 'DONE', 'done'), 'done')]",
-                
-                # Class-based selectors
-                "//button[contains(@class, 'save')]",
-                "//button[contains(@class, 'submit')]",
-                "//button[contains(@class, 'primary')]",
-                "//button[contains(@class, 'btn-primary')]",
-                "//button[contains(@class, 'positive')]",
-                
-                # Type-based selectors
-                "//button[@type='submit']",
-                "//input[@type='submit']",
-                "//button[@type='button'][contains(@class, 'primary')]",
-                
-                # Form selectors
-                "//form//button[@type='submit']",
-                "//form//button[contains(@class, 'primary')]",
-                "//form//button[not(@type='button') and not(@type='reset')]",
-                
-                # Modal/Dialog selectors
-                "//div[@role='dialog']//button[contains(@class, 'primary')]",
-                "//div[@role='dialog']//button[@type='submit']",
-                "//div[contains(@class, 'modal')]//button[contains(@class, 'primary')]",
-                
-                # Naukri-specific possibilities
-                "//button[@id='saveButton']",
-                "//button[contains(@ng-click, 'save')]",
-                "//button[contains(@onclick, 'save')]"
-            ]
-            
-            # Try each selector
-            for selector in save_selectors:
-                try:
-                    # Don't wait too long for each selector
-                    save_button = WebDriverWait(self.driver, 2).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    
-                    if save_button.is_displayed() and save_button.is_enabled():
-                        btn_text = save_button.text or "no-text"
-                        logger.info(f"Found potential save button: '{btn_text}' with selector: {selector}")
-                        
-                        # Try to click it
-                        try:
-                            save_button.click()
-                        except:
-                            # If regular click fails, use JavaScript
-                            self.driver.execute_script("arguments[0].click();", save_button)
-                        
-                        logger.info(f"Successfully clicked save button: '{btn_text}'")
-                        time.sleep(3)
+                if self._safe_click(locate_save_button):
+                    logger.info(f"Successfully clicked save button with selector: {matched['selector']}")
+                    # Only a confirmed save counts - a wrong button ranked first
+                    # would otherwise reinforce itself on every later run
+                    if self._confirm_save():
+                        self._record_hit('save', matched['selector'])
                         return True
-                        
-                except TimeoutException:
-                    continue
-                except Exception as e:
-                    continue
+                    return False
+            except WebDriverException as e:
+                logger.warning(f"Save button click failed: {e}")
             
             # Ultra last resort - click ANY visible button that might be save
             logger.warning("Trying ultra last resort - any button that might be save...")
             try:
-                buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                for button in buttons:
-                    try:
-                        if button.is_displayed() and button.is_enabled():
-                            btn_text = button.text.strip().lower()
-                            btn_class = (button.get_attribute("class") or "").lower()
-                            
-                            # Check if this could be a save button
-                            save_keywords = ['save', 'update', 'submit', 'apply', 'done', 'ok', 'confirm']
-                            class_keywords = ['primary', 'submit', 'save', 'positive', 'success']
-                            
-                            if any(keyword in btn_text for keyword in save_keywords) or \
-                               any(keyword in btn_class for keyword in class_keywords):
-                                logger.info(f"Attempting to click button: '{button.text}'")
-                                self.driver.execute_script("arguments[0].click();", button)
-                                logger.info(f"Clicked button: '{button.text}'")
-                                time.sleep(3)
-                                return True
-                    except:
-                        continue
+                # Text/class keyword match runs in the page - no per-button round-trips
+                clicked_text = self.driver.execute_script(
+                    self.CLICK_SAVE_LIKE_BUTTON_JS,
+                    list(self.SAVE_TEXT_KEYWORDS), list(self.SAVE_CLASS_KEYWORDS)
+                )
+                if clicked_text is not None:
+                    logger.info(f"Clicked button: '{clicked_text}'")
+                    return self._confirm_save()
             except Exception as e:
                 logger.error(f"Ultra last resort failed: {e}")
             
@@ -544,12 +1132,7 @@ class NaukriProfileRefresher:
             logger.error("Could not find save button after trying all methods")
             
             # Take a screenshot for debugging
-            try:
-                screenshot_path = f"save_button_not_found_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                self.driver.save_screenshot(screenshot_path)
-                logger.info(f"Screenshot saved: {screenshot_path}")
-            except:
-                pass
+            self._debug_screenshot("save_button_not_found")
             
             return False
             
@@ -557,125 +1140,343 @@ class NaukriProfileRefresher:
             logger.error(f"Critical error in save button function: {e}")
             return False
     
-    def _human_type(self, element, text):
-        """Type text with faster, more reasonable delays"""
-        element.clear()
-        # Much faster typing - 2-5 milliseconds per character instead of 50-150ms
-        for char in text:
-            element.send_keys(char)
-            time.sleep(random.uniform(0.002, 0.005))  # Reduced from 0.05-0.15
+    def _confirm_save(self):
+        """Wait for the save to land after the click; a save that never does is a failure"""
+        if self._wait_for_save_confirmation():
+            return True
+        logger.error("Save button clicked but the save was never confirmed")
+        return False
     
-    def _get_toggle_state(self, key):
-        """Get current toggle state from file"""
+    def _debug_screenshot(self, name):
+        """
+        Save the viewport as a low-quality JPEG under debug_screenshots/ for debugging.
+        Skipped on GitHub Actions unless DEBUG_SCREENSHOTS is set; there the workflow
+        uploads the folder as an artifact (and notes it in the job summary) when the run fails.
+        """
+        if os.getenv('GITHUB_ACTIONS') and not os.getenv('DEBUG_SCREENSHOTS'):
+            return
         try:
-            if os.path.exists(self.state_files.get(key, '')):
-                with open(self.state_files[key], 'r') as f:
-                    return f.read().strip() == 'True'
-        except:
-            pass
-        return False
+            # JPEG at q40 is a fraction of the PNG's size and quicker to encode
+            data = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
+                'format': 'jpeg', 'quality': 40, 'captureBeyondViewport': False
+            })['data']
+            os.makedirs(self.SCREENSHOT_DIR, exist_ok=True)
+            screenshot_path = os.path.join(
+                self.SCREENSHOT_DIR, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
+            )
+            with open(screenshot_path, 'wb') as f:
+                f.write(base64.b64decode(data))
+            logger.info(f"Screenshot saved: {screenshot_path}")
+        except (WebDriverException, OSError) as e:
+            logger.warning(f"Could not take screenshot: {e}")
     
-    def _set_toggle_state(self, key, value):
-        """Save toggle state to file"""
+    def _safe_click(self, locate_fn, tries=3):
+        """
+        Locate an element and click it, locating it again straight away if it goes stale.
+        Returns the clicked element, or None when locate_fn finds nothing.
+        """
+        for _ in range(tries):
+            element = locate_fn()
+            if element is None:
+                return None
+            try:
+                try:
+                    element.click()
+                except StaleElementReferenceException:
+                    raise
+                except WebDriverException:
+                    # Covered or not interactable - a script click still lands
+                    self.driver.execute_script("arguments[0].click();", element)
+                return element
+            except StaleElementReferenceException:
+                logger.debug("Element went stale before the click - locating it again")
+        return None
+    
+    def _js_set_value(self, element, text):
+        """Set a field value in one call and fire the events the page listens for"""
+        # Going through the prototype's setter keeps framework value trackers
+        # (React and friends) in sync, so the input event isn't dropped as a no-op
+        self.driver.execute_script(
+            "const e = arguments[0];"
+            "const proto = e instanceof HTMLTextAreaElement"
+            " ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;"
+            "Object.getOwnPropertyDescriptor(proto, 'value').set.call(e, arguments[1]);"
+            "e.dispatchEvent(new Event('input', {bubbles: true}));"
+            "e.dispatchEvent(new Event('change', {bubbles: true}));",
+            element, text
+        )
+    
+    def _fill_field(self, element, text):
+        """Replace a field's value - one JS call unless humanize_typing is on"""
+        if self.humanize:
+            self._human_type(element, text)
+            return
+        
+        self._js_set_value(element, text)
+        # One real keystroke for pages that validate on keydown/keyup rather than input
         try:
-            with open(self.state_files.get(key, f'{key}_state.txt'), 'w') as f:
-                f.write(str(value))
-        except:
+            element.send_keys(Keys.END)
+        except ElementNotInteractableException:
             pass
     
+    def _js_clear(self, element):
+        """Empty a field in one script call, firing only the input event frameworks listen for"""
+        self.driver.execute_script(
+            "const e = arguments[0];"
+            "if (e.isContentEditable) { e.textContent = ''; } else { e.value = ''; }"
+            "e.dispatchEvent(new Event('input', {bubbles: true}));",
+            element
+        )
+    
+    def _human_type(self, element, text):
+        """Type text in short bursts - the humanize_typing path of _fill_field"""
+        self._js_clear(element)
+        
+        # 3-5 chunks with a pause between keep an uneven typing rhythm at a
+        # fixed handful of round-trips, however long the text is
+        step = -(-len(text) // random.randint(3, 5)) or 1
+        for i in range(0, len(text), step):
+            if i:
+                time.sleep(random.uniform(0.05, 0.15))
+            element.send_keys(text[i:i + step])
+    
+    def _read_json(self, path):
+        """Read a JSON state file, returning an empty dict when missing or unreadable"""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read {path}: {e}")
+            return {}
+    
+    def _write_json(self, path, data):
+        """Write a JSON file atomically - a crash mid-write leaves the old file intact"""
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+        
+        # A unique temp file in the same directory, so concurrent runs can't share
+        # one and os.replace stays a same-filesystem rename
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(path)),
+                prefix=f".{os.path.basename(path)}.", suffix='.tmp'
+            )
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save {path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _file_mtime(self, path):
+        """Modification time of a file, or None if it doesn't exist"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _load_states(self):
+        """Load toggle states and last strategy from the state file"""
+        self._states_mtime = self._file_mtime(self.state_path)
+        if self._states_mtime is None:
+            return self._migrate_legacy_states() if self._owns_legacy_state else {}
+        return self._read_json(self.state_path)
+    
+    def _migrate_legacy_states(self):
+        """Pick up the per-key .txt state files older versions wrote, so rotation carries over"""
+        states = {}
+        legacy_files = {
+            'last_strategy': 'last_strategy.txt',
+            'headline_toggle': 'headline_toggle_state.txt',
+            'summary_fullstop': 'summary_fullstop_state.txt'
+        }
+        for key, path in legacy_files.items():
+            try:
+                with open(path, 'r') as f:
+                    value = f.read().strip()
+            except OSError:
+                continue
+            states[key] = value if key == 'last_strategy' else value == 'True'
+        
+        if states:
+            logger.info("Migrated legacy state files into the single state file")
+        return states
+    
+    def _sync_states(self):
+        """Re-read the state file only if another run rewrote it since it was loaded"""
+        if self._states_dirty:
+            return
+        if self._file_mtime(self.state_path) != self._states_mtime:
+            self._states = self._load_states()
+    
+    def _flush_states(self):
+        """Write toggle states, selector stats and the session log once, if anything changed"""
+        if self._states_dirty:
+            self._write_json(self.state_path, self._states)
+            self._states_dirty = False
+            self._states_mtime = self._file_mtime(self.state_path)
+        if self._stats_dirty:
+            self._write_json(self.selector_stats_path, self._sel_stats)
+            self._stats_dirty = False
+        if self._session_log:
+            self._write_json(self.log_path, self._session_log)
+            self._session_log = None
+    
+    def _ranked(self, name, selectors):
+        """Order selector candidates by how often each matched on earlier runs"""
+        return sorted(selectors, key=lambda s: -self._sel_stats.get(f'{name}:{s}', 0))
+    
+    def _record_hit(self, name, selector):
+        """Count a successful match for a selector candidate"""
+        key = f'{name}:{selector}'
+        self._sel_stats[key] = self._sel_stats.get(key, 0) + 1
+        self._stats_dirty = True
+    
+    def _get_toggle_state(self, key):
+        """Get current toggle state"""
+        self._sync_states()
+        return self._states.get(key, False)
+    
+    def _set_toggle_state(self, key, value):
+        """Record toggle state (persisted by _flush_states)"""
+        self._states[key] = value
+        self._states_dirty = True
+    
     def get_next_strategy(self):
         """Get the next update strategy in rotation"""
-        try:
-            if os.path.exists(self.last_strategy_file):
-                with open(self.last_strategy_file, 'r') as f:
-                    last_strategy = f.read().strip()
-                    if last_strategy in self.update_strategies:
-                        last_index = self.update_strategies.index(last_strategy)
-                        next_index = (last_index + 1) % len(self.update_strategies)
-                        return self.update_strategies[next_index]
-        except:
-            pass
+        self._sync_states()
+        last_strategy = self._states.get('last_strategy')
+        if last_strategy in self.update_strategies:
+            last_index = self.update_strategies.index(last_strategy)
+            next_index = (last_index + 1) % len(self.update_strategies)
+            return self.update_strategies[next_index]
         
         return self.update_strategies[0]
     
     def save_last_strategy(self, strategy):
-        """Save the last used strategy"""
-        try:
-            with open(self.last_strategy_file, 'w') as f:
-                f.write(strategy)
-        except:
-            pass
+        """Record the last used strategy (persisted by _flush_states)"""
+        self._states['last_strategy'] = strategy
+        self._states_dirty = True
+    
+    def _ensure_profile_page(self):
+        """
+        Load the profile page and snapshot its edit controls - a restored session is
+        usually already there. The altresid URL is the same SPA route, so a slow render gets more
+        time on the page already loading rather than a second full load.
+        """
+        if self._on_profile_page():
+            self._snapshot_edit_controls()
+        elif not self._open_profile() and self._wait_for_profile():
+            self._snapshot_edit_controls()
     
     def update_profile(self):
         """Navigate to profile and make updates with skills_update as fallback"""
         try:
             logger.info("Navigating to profile edit page...")
             
-            # Navigate to profile
-            profile_urls = [
-                'https://www.naukri.com/mnjuser/profile',
-                'https://www.naukri.com/mnjuser/profile?id=&altresid='
-            ]
-            
-            for url in profile_urls:
-                self.driver.get(url)
-                time.sleep(3)
-                if "profile" in self.driver.current_url:
-                    break
+            self._ensure_profile_page()
             
-            # Get next strategy
+            # One strategy per run, with fallbacks only on failure - strategies are
+            # alternatives rather than independent jobs, so they stay sequential on the
+            # logged-in session instead of fanning out to extra browser sessions
             strategy = self.get_next_strategy()
+            self._used_strategy = strategy
             logger.info(f"Using strategy: {strategy}")
             
             # Execute strategy
-            success = False
-            if strategy == 'headline_toggle':
-                success = self._update_headline()
-            elif strategy == 'summary_fullstop_toggle':
-                success = self._update_summary()
-            elif strategy == 'skills_update':
-                success = self._update_skills()
-            
-            if success:
+            if self._dispatch[strategy]():
                 self.save_last_strategy(strategy)
                 logger.info(f"Profile update successful using {strategy}")
                 return True
-            else:
-                # FALLBACK TO SKILLS_UPDATE - the most reliable strategy
-                logger.warning(f"Strategy {strategy} failed, trying fallback: skills_update")
-                
-                # Navigate back to profile if needed
-                if "profile" not in self.driver.current_url:
-                    self.driver.get('https://www.naukri.com/mnjuser/profile')
-                    time.sleep(3)
-                
-                # Try skills_update as fallback
-                fallback_success = self._update_skills()
-                
-                if fallback_success:
-                    # Still save the original strategy as "attempted" to maintain rotation
-                    self.save_last_strategy(strategy)
-                    logger.info(f"Profile update successful using fallback (skills_update)")
-                    return True
-                else:
-                    logger.error(f"Both {strategy} and fallback failed")
-                    return False
+            
+            fallback = self._try_next_strategy(strategy)
+            if fallback:
+                self._used_strategy = fallback
+                # Still save the original strategy as "attempted" to maintain rotation
+                self.save_last_strategy(strategy)
+                logger.info(f"Profile update successful using fallback ({fallback})")
+                return True
+            
+            logger.error(f"Strategy {strategy} and all fallbacks failed")
+            return False
             
         except Exception as e:
             logger.error(f"Profile update failed: {e}")
-            # Last ditch effort - try skills_update
+            # Last ditch effort - try the most reliable strategy
             try:
-                logger.info("Attempting emergency fallback to skills_update...")
-                if "profile" not in self.driver.current_url:
-                    self.driver.get('https://www.naukri.com/mnjuser/profile')
-                    time.sleep(3)
-                if self._update_skills():
+                logger.info(f"Attempting emergency fallback to {self.fallback_strategy}...")
+                if not self._on_profile_page():
+                    self._open_profile()
+                if self._dispatch[self.fallback_strategy]():
+                    self._used_strategy = self.fallback_strategy
                     logger.info("Emergency fallback successful!")
                     return True
-            except:
+            except Exception:
                 pass
             return False
     
+    def _try_next_strategy(self, failed_strategy):
+        """
+        Try the remaining strategies after a failure, skills_update first.
+        Returns the name of the strategy that succeeded, or None.
+        """
+        count = len(self.update_strategies)
+        start = self.update_strategies.index(failed_strategy)
+        rotation = [self.update_strategies[(start + offset) % count] for offset in range(1, count)]
+        candidates = [self.fallback_strategy] + [s for s in rotation if s != self.fallback_strategy]
+        
+        for strategy in candidates:
+            if strategy == failed_strategy:
+                continue
+            logger.warning(f"Strategy {failed_strategy} failed, trying fallback: {strategy}")
+            self._reset_profile_page()
+            
+            if self._dispatch[strategy]():
+                return strategy
+        
+        return None
+    
+    def update_all_sections(self):
+        """
+        Run every update strategy on the one logged-in session rather than one per run,
+        so driver startup and login are paid once for all sections
+        """
+        try:
+            logger.info("Updating all profile sections...")
+            self._ensure_profile_page()
+            
+            updated = []
+            for strategy in self.update_strategies:
+                if self._dispatch[strategy]():
+                    updated.append(strategy)
+                else:
+                    logger.warning(f"Strategy {strategy} failed")
+                # Close whatever edit layer the strategy left before the next one
+                self._reset_profile_page()
+            
+            self._used_strategy = '+'.join(updated) or None
+            if not updated:
+                logger.error("All section updates failed")
+                return False
+            logger.info(f"Updated {len(updated)}/{len(self.update_strategies)} sections: {', '.join(updated)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Section updates failed: {e}")
+            return False
+    
+    def _run_updates(self, all_sections=None):
+        """One rotated strategy per run, or every section when configured (update_all_sections)"""
+        if all_sections is None:
+            all_sections = self.config.get('update_all_sections', False)
+        return self.update_all_sections() if all_sections else self.update_profile()
+    
     def _update_headline(self):
         """Toggle between two headline versions with proper error handling"""
         try:
@@ -686,10 +1487,8 @@ class NaukriProfileRefresher:
                 logger.error("Could not open headline edit")
                 return False
             
-            time.sleep(2)
-            
-            # Find the headline field
-            headline_field = self._find_profile_field([
+            # Wait for the headline field itself rather than a fixed delay
+            headline_field = self._wait_profile_field(self.HEADLINE_FIELD_SELECTOR, [
                 "resumeHeadline",
                 "headline",
                 "Headline",
@@ -717,13 +1516,15 @@ class NaukriProfileRefresher:
             else:
                 # Toggle between our two versions
                 should_use_b = self._get_toggle_state('headline_toggle')
+                # Saved state out of sync with the page - saving the same text would
+                # be a wasted round of edits that Naukri may not count as an update
+                if current_headline.strip() == (headline_b if should_use_b else headline_a):
+                    should_use_b = not should_use_b
                 new_headline = headline_b if should_use_b else headline_a
                 self._set_toggle_state('headline_toggle', not should_use_b)
             
             # Update the field
-            headline_field.clear()
-            self._human_type(headline_field, new_headline)
-            time.sleep(1)
+            self._fill_field(headline_field, new_headline)
             
             # Save changes - WITH PROPER ERROR HANDLING
             if self._click_save_button():
@@ -749,10 +1550,8 @@ class NaukriProfileRefresher:
                     logger.error("Could not open summary edit")
                     return False
             
-            time.sleep(2)
-            
-            # Find the summary field
-            summary_field = self._find_profile_field([
+            # Wait for the summary field itself rather than a fixed delay
+            summary_field = self._wait_profile_field(self.SUMMARY_FIELD_SELECTOR, [
                 "summary",
                 "profileSummary",
                 "Summary",
@@ -763,21 +1562,15 @@ class NaukriProfileRefresher:
                 logger.error("Could not find summary field")
                 return False
             
-            # Get current summary
-            current_summary = summary_field.get_attribute('value') or summary_field.text
-            
-            # Toggle fullstop
-            if current_summary.rstrip().endswith('.'):
-                new_summary = current_summary.rstrip()[:-1]
-                logger.info("Removing fullstop from summary")
+            # Toggle the trailing fullstop; _fill_field goes through the value setter
+            # React tracks, so the edit isn't discarded as a no-op
+            current_summary = (summary_field.get_attribute('value') or '').rstrip()
+            if current_summary.endswith('.'):
+                self._fill_field(summary_field, current_summary[:-1])
+                logger.info("Removed fullstop from summary")
             else:
-                new_summary = current_summary.rstrip() + '.'
-                logger.info("Adding fullstop to summary")
-            
-            # Update the field
-            summary_field.clear()
-            self._human_type(summary_field, new_summary)
-            time.sleep(1)
+                self._fill_field(summary_field, current_summary + '.')
+                logger.info("Added fullstop to summary")
             
             # Save changes - WITH PROPER ERROR HANDLING
             if self._click_save_button():
@@ -803,8 +1596,6 @@ class NaukriProfileRefresher:
                     logger.error("Could not open skills edit")
                     return False
             
-            time.sleep(3)
-            
             # For skills, just opening and saving is enough to trigger an update
             # The act of visiting the section counts as activity
             
@@ -820,13 +1611,17 @@ class NaukriProfileRefresher:
             logger.error(f"Skills update failed: {e}")
             return False
     
-    def run_profile_refresh(self, debug_mode=False):
+    def run_profile_refresh(self, debug_mode=False, all_sections=None):
         """Main execution method"""
         try:
             logger.info("Starting Naukri Profile Refresh...")
             
-            # Setup driver
-            if not self.setup_driver(debug_mode=debug_mode):
+            # Setup driver - Naukri's DNS lookup is warmed in the background meanwhile
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(self._prewarm)
+                driver_ready = self.setup_driver(debug_mode=debug_mode)
+            
+            if not driver_ready:
                 logger.error("Failed to setup driver")
                 return False
             
@@ -836,7 +1631,7 @@ class NaukriProfileRefresher:
                 return False
             
             # Update profile
-            if not self.update_profile():
+            if not self._run_updates(all_sections):
                 logger.error("Failed to update profile")
                 return False
             
@@ -852,23 +1647,104 @@ class NaukriProfileRefresher:
             return False
         
         finally:
+            # Single state write per run, even when login or the update failed
+            self._flush_states()
             if self.driver:
                 self.driver.quit()
     
-    def _log_session(self):
-        """Log session information"""
+    def run_profile_refresh_all(self, debug_mode=False):
+        """Refresh headline, summary and skills in one run, sharing a single browser and login"""
+        return self.run_profile_refresh(debug_mode=debug_mode, all_sections=True)
+    
+    @classmethod
+    def run_all(cls, config_file="config.json", debug_mode=False):
+        """
+        Refresh every account in the config's "accounts" list in parallel, one browser each.
+        Configs with a single set of credentials go through run_profile_refresh as before.
+        """
+        first = cls(config_file)
+        accounts = first.config.get('accounts') or []
+        if len(accounts) < 2:
+            return first.run_profile_refresh(debug_mode=debug_mode)
+        
+        # config.json is parsed once and shared by every account's refresher
+        refreshers = [cls(first.config, account_index=i) for i in range(len(accounts))]
+        
+        # Start the first browser up front so the workers don't race Selenium Manager
+        # to download a driver; its refresh reuses this session
+        refreshers[0].setup_driver(debug_mode=debug_mode)
+        workers = min(len(refreshers), os.cpu_count() or 1)
+        logger.info(f"Refreshing {len(refreshers)} accounts with {workers} browsers")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda r: r.run_profile_refresh(debug_mode=debug_mode), refreshers))
+        
+        for index, ok in enumerate(results):
+            if not ok:
+                logger.error(f"Account {index} refresh failed")
+        return all(results)
+    
+    def run_daemon(self, debug_mode=False, interval=3600, start_hour=7, end_hour=22):
+        """
+        Refresh every `interval` seconds on one long-lived browser between `start_hour`
+        and `end_hour` IST, waiting for the window to open if started early.
+        Chrome startup and driver resolution are paid once; each cycle only re-checks
+        the session (which reloads the profile page) and runs the next strategy.
+        Returns False if any cycle failed or none ran.
+        """
+        if len(self.config.get('accounts') or []) > 1:
+            logger.error("--daemon refreshes a single account - use the scheduled run for an accounts list")
+            return False
+        
+        ist = timezone(timedelta(hours=5, minutes=30))
+        cycles = failures = 0
         try:
-            session_info = {
-                'timestamp': datetime.now().isoformat(),
-                'status': 'success',
-                'strategy_used': self.get_next_strategy()
-            }
-            
-            with open('profile_refresh_log.json', 'w') as f:
-                json.dump(session_info, f, indent=2)
+            now = datetime.now(ist)
+            if now.hour < start_hour:
+                opens = now.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+                logger.info(f"Waiting until {start_hour}:00 IST to start refreshing")
+                time.sleep((opens - now).total_seconds())
+            
+            while start_hour <= datetime.now(ist).hour < end_hour:
+                # setup_driver reuses the live session and only restarts a crashed browser
+                if (self.setup_driver(debug_mode=debug_mode)
+                        and self.login_to_naukri()
+                        and self._run_updates()):
+                    self._log_session()
+                    logger.info("Profile refresh completed successfully!")
+                else:
+                    failures += 1
+                    logger.error("Profile refresh cycle failed")
+                cycles += 1
+                self._flush_states()
                 
-        except Exception as e:
-            logger.error(f"Logging failed: {e}")
+                if (datetime.now(ist) + timedelta(seconds=interval)).hour >= end_hour:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped")
+        finally:
+            self._flush_states()
+            if self.driver:
+                self.driver.quit()
+        
+        if not cycles:
+            logger.error(f"No refresh ran - outside the {start_hour}:00-{end_hour}:00 IST window")
+        return cycles > 0 and failures == 0
+    
+    def _prewarm(self):
+        """Resolve Naukri's hostname while Chrome starts so the first page load finds it cached"""
+        try:
+            socket.gethostbyname('www.naukri.com')
+        except OSError as e:
+            logger.warning(f"Could not pre-resolve www.naukri.com: {e}")
+    
+    def _log_session(self):
+        """Record session information (persisted by _flush_states)"""
+        self._session_log = {
+            'timestamp': datetime.now().isoformat(),
+            'status': 'success',
+            'strategy_used': self._used_strategy
+        }
 
 # Main execution
 if __name__ == "__main__":
@@ -883,8 +1759,15 @@ if __name__ == "__main__":
     if debug_mode:
         print("RUNNING IN DEBUG MODE (visible browser)")
     
-    refresher = NaukriProfileRefresher()
-    success = refresher.run_profile_refresh(debug_mode=debug_mode)
+    # The DOM and selector dumps log at DEBUG - enable them with --debug or DEBUG=1
+    if debug_mode or os.getenv('DEBUG'):
+        logger.setLevel(logging.DEBUG)
+    
+    # Long-running mode: one browser for the whole day instead of one per scheduled run
+    if "--daemon" in sys.argv:
+        success = NaukriProfileRefresher().run_daemon(debug_mode=debug_mode)
+    else:
+        success = NaukriProfileRefresher.run_all(debug_mode=debug_mode)
     
     if success:
         print("Profile refresh completed successfully!")
@@ -75,6 +75,9 @@ def test_profile_refresher():
         else:
             print("⚠️ Profile update failed, but login worked")
         
+        # run_profile_refresh normally persists states; do it here since we drive the steps manually
+        refresher._flush_states()
+        
         print("\n🎉 Local test completed!")
         print("✅ All systems working - ready for automation!")
         
@@ -104,8 +107,6 @@ def setup_local_chrome_driver(refresher):
     try:
         from selenium import webdriver
         from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.chrome.service import Service as ChromeService
-        from webdriver_manager.chrome import ChromeDriverManager
         
         print("🔧 Setting up Chrome WebDriver for testing...")
         
@@ -122,41 +123,22 @@ def setup_local_chrome_driver(refresher):
         # User agent
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        # Try automatic Chrome driver setup
+        # Same page-load strategy as the production driver; the refresher's
+        # explicit waits assume driver.get returns at DOMContentLoaded
+        options.page_load_strategy = 'eager'
+        
+        # Selenium Manager (built into Selenium 4.11+) finds or downloads the driver
         try:
-            service = ChromeService(ChromeDriverManager().install())
-            refresher.driver = webdriver.Chrome(service=service, options=options)
-            print("✅ Chrome driver auto-download successful")
+            refresher.driver = webdriver.Chrome(options=options)
+            print("✅ Chrome driver resolved by Selenium Manager")
         except Exception as e:
-            print(f"⚠️ Auto-download failed: {e}")
-            # Try manual path fallback
-            manual_paths = [
-                r"C:\WebDrivers\chromedriver.exe",
-                r"C:\chromedriver\chromedriver.exe",
-                "/usr/local/bin/chromedriver",
-                "/usr/bin/chromedriver",
-                "chromedriver.exe",  # If in PATH
-                "chromedriver"  # If in PATH (Linux/Mac)
-            ]
-            
-            driver_found = False
-            for path in manual_paths:
-                if os.path.exists(path):
-                    print(f"🔄 Trying manual path: {path}")
-                    service = ChromeService(path)
-                    refresher.driver = webdriver.Chrome(service=service, options=options)
-                    driver_found = True
-                    break
-            
-            if not driver_found:
-                print("❌ No Chrome driver found!")
-                print("Please install ChromeDriver:")
-                print("  - Download from: https://chromedriver.chromium.org/")
-                print("  - Or install via: pip install webdriver-manager")
-                return False
+            print(f"❌ No Chrome driver found: {e}")
+            print("Please install Google Chrome and selenium>=4.15:")
+            print("  - pip install --upgrade selenium")
+            return False
         
         refresher.driver.set_window_size(1280, 720)
-        refresher.driver.implicitly_wait(10)
+        refresher.driver.implicitly_wait(0)
         refresher.wait = WebDriverWait(refresher.driver, 20)
         
         print("✅ Chrome driver ready (visible mode for testing)")
@@ -179,8 +161,7 @@ def check_prerequisites():
     
     # Check required packages
     required_packages = {
-        'selenium': 'selenium',
-        'webdriver_manager': 'webdriver-manager'
+        'selenium': 'selenium'
     }
     
     missing_packages = []